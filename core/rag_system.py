@@ -1,5 +1,6 @@
 from .storage.database import DocumentStorage
 from .llm.groq_client import GroqLLM
+from .reranker.cross_encoder import CrossEncoderReranker
 from .config_loader import config
 from typing import Dict, Any, List
 
@@ -8,9 +9,15 @@ class RAGSystem:
         self.storage = DocumentStorage()
         self.llm = GroqLLM()
         self.max_results = config.get('ui.max_search_results', 5)
+        self.reranker = CrossEncoderReranker() if config.get('reranker.enabled', False) else None
+        self.candidate_count = config.get('reranker.candidate_count', 20)
     
     def query(self, question: str) -> Dict[str, Any]:
-        search_results = self.storage.search(question, n_results=self.max_results)
+        if self.reranker:
+            candidates = self.storage.search(question, n_results=self.candidate_count)
+            search_results = self.reranker.rerank(question, candidates)
+        else:
+            search_results = self.storage.search(question, n_results=self.max_results)
         
         if not search_results:
             return {
@@ -23,12 +30,15 @@ class RAGSystem:
         
         sources = []
         for result in search_results:
-            sources.append({
+            source = {
                 'source': result['metadata'].get('source', 'Unknown'),
                 'content_preview': result['content'][:200] + "...",
                 'similarity': result['similarity'],
                 'page': result['metadata'].get('page_number')
-            })
+            }
+            if 'rerank_score' in result:
+                source['rerank_score'] = result['rerank_score']
+            sources.append(source)
         
         return {
             'answer': answer,
@@ -42,5 +52,6 @@ class RAGSystem:
             'total_documents': self.storage.get_count(),
             'llm_model': self.llm.model,
             'embedding_model': config.get('database.embedding_model'),
+            'reranker_model': self.reranker.model_name if self.reranker else None,
             'llm_connected': self.llm.test_connection()
         }
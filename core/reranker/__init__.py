@@ -0,0 +1 @@
+# Reranker module
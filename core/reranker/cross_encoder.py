@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple
+from sentence_transformers import CrossEncoder
+from ..config_loader import config
+
+class CrossEncoderReranker:
+    def __init__(self):
+        self.model_name = config.get('reranker.model', 'cross-encoder/ms-marco-MiniLM-L-6-v2')
+        self.top_k = config.get('reranker.top_k', 3)
+        self.batch_size = config.get('reranker.batch_size', 16)
+        self.cache_size = config.get('reranker.cache_size', 2048)
+        self.model = CrossEncoder(self.model_name)
+        self._cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+    
+    def _cache_get(self, key: Tuple[str, str]):
+        score = self._cache.get(key)
+        if score is not None:
+            self._cache.move_to_end(key)
+        return score
+    
+    def _cache_put(self, key: Tuple[str, str], score: float) -> None:
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def rerank(self, query: str, candidates: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
+        if not candidates:
+            return []
+        
+        top_k = top_k or self.top_k
+        scores = [None] * len(candidates)
+        pending = []
+        
+        for i, candidate in enumerate(candidates):
+            scores[i] = self._cache_get((query, candidate['id']))
+            if scores[i] is None:
+                pending.append(i)
+        
+        if pending:
+            pairs = [(query, candidates[i]['content']) for i in pending]
+            new_scores = self.model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False)
+            for i, score in zip(pending, new_scores):
+                scores[i] = float(score)
+                self._cache_put((query, candidates[i]['id']), scores[i])
+        
+        ranked = []
+        for candidate, score in zip(candidates, scores):
+            ranked.append({**candidate, 'rerank_score': score})
+        ranked.sort(key=lambda result: result['rerank_score'], reverse=True)
+        
+        return ranked[:top_k]
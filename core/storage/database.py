@@ -59,10 +59,12 @@ class DocumentStorage:
             documents = results.get("documents", [[]])[0]
             metadatas = results.get("metadatas", [[]])[0]
             distances = results.get("distances", [[]])[0]
+            ids = results.get("ids", [[]])[0]
             
             search_results = []
-            for doc, meta, dist in zip(documents, metadatas, distances):
+            for doc_id, doc, meta, dist in zip(ids, documents, metadatas, distances):
                 search_results.append({
+                    "id": doc_id,
                     "content": doc,
                     "metadata": meta,
                     "similarity": 1 - dist if dist else 0